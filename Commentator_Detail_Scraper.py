@@ -7,14 +7,23 @@ import os
 import time
 import pandas as pd
 import csv
+from browser_session import BrowserSession
+from page_profiler import profile_page, record_navigation
 
 
 class KickstarterScraper:
-    def __init__(self):
+    def __init__(self, max_pages=100, max_rss_mb=1500, profiler=None):
         """
-            Initializes a scraper class and creates a Web Driver session
+            Initializes a scraper class and creates a managed Web Driver session that is
+            recycled after max_pages project pages or once the browser exceeds max_rss_mb.
+            Pass a PageProfiler to record performance traces for sampled and slow pages.
         """
-        self.driver = self.setup_webdriver()
+        self.session = BrowserSession(self.setup_webdriver, max_pages=max_pages, max_rss_mb=max_rss_mb)
+        self.profiler = profiler
+
+    @property
+    def driver(self):
+        return self.session.driver
 
     @staticmethod
     def setup_webdriver():
@@ -112,6 +121,7 @@ class KickstarterScraper:
 
         # Loads the project page
         self.driver.get(url)
+        record_navigation(self.profiler, self.driver)
         game_name = self.driver.title.strip()
         print(f"Scraping: {game_name}")
         WebDriverWait(self.driver, 5).until(EC.presence_of_element_located((By.TAG_NAME, "body")))
@@ -167,6 +177,13 @@ class KickstarterScraper:
 
         return game_name, collected_data
 
+    def profiled_scrape(self, url):
+        """
+            Runs scrape_commentator_name_picture for one project, traced by the profiler if one is set.
+        """
+        with profile_page(self.profiler, self.driver, url):
+            return self.scrape_commentator_name_picture(url)
+
     @staticmethod
     def save_results(file_path, game_name, commentator_data):
         """
@@ -203,7 +220,8 @@ class KickstarterScraper:
             output_filepath: path to storage file
         """
         for link in links:
-            game_name, commentator_data = self.scrape_commentator_name_picture(link)
+            game_name, commentator_data = self.session.run(self.profiled_scrape, link,
+                                                                suspect_result=lambda result: not result[1])
             if commentator_data:
                 self.save_results(output_filepath, game_name, commentator_data)
             else:
@@ -211,7 +229,7 @@ class KickstarterScraper:
                 break
 
     def close(self):
-        self.driver.quit()
+        self.session.quit()
         print("Driver session ended.")
 
 
@@ -4,14 +4,17 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import undetected_chromedriver as uc
 import csv
+from page_profiler import profile_page, record_navigation
 
 
 class GamesCrawler:
-    def __init__(self):
+    def __init__(self, profiler=None):
         """
-            Initializes a scraper class and creates a Web Driver session
+            Initializes a scraper class and creates a Web Driver session.
+            Pass a PageProfiler to record performance traces for sampled and slow pages.
         """
         self.driver = self.setup_webdriver()
+        self.profiler = profiler
 
     @staticmethod
     def setup_webdriver():
@@ -54,6 +57,46 @@ class GamesCrawler:
 
         return webdriver
 
+    def discover_page_extractor(self, url, writer):
+        """
+            Loads one discover page and writes the name and URL of every game card on it.
+
+            Returns:
+            - The list of game cards found on the page.
+        """
+        self.driver.get(url)
+        record_navigation(self.profiler, self.driver)
+
+        wait = WebDriverWait(self.driver, 10)
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+
+        time.sleep(2)
+        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        time.sleep(1)
+        self.driver.execute_script("window.scrollTo(0, 0);")
+
+        game_cards = wait.until(
+            EC.presence_of_all_elements_located(
+                (By.CSS_SELECTOR, "div.discovery-project-card")
+            )
+        )
+
+        print(f"Found {len(game_cards)} games")
+
+        for game in game_cards:
+            try:
+                element = game.find_element(By.CSS_SELECTOR, "a.project-card__title")
+                game_name = element.text.strip()
+                game_url = element.get_attribute("href").strip()
+                if game_url:
+                    writer.writerow([game_name, game_url])
+
+            except Exception as e:
+                print(f"Error extracting game: {e}")
+                continue
+
+        return game_cards
+
     def games_url_extractor(self, link, output_file):
         with open(output_file, "a", newline='', encoding="utf-8") as file:
             writer = csv.writer(file)
@@ -64,42 +107,17 @@ class GamesCrawler:
 
             try:
                 while True:
-                    self.driver.get(f"{link}{page}")
+                    url = f"{link}{page}"
                     page += 1
                     print(f"Scraping page {page}")
 
-                    wait = WebDriverWait(self.driver, 10)
-                    wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-
-                    time.sleep(2)
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1)
-                    self.driver.execute_script("window.scrollTo(0, 0);")
-
-                    game_cards = wait.until(
-                        EC.presence_of_all_elements_located(
-                            (By.CSS_SELECTOR, "div.discovery-project-card")
-                        )
-                    )
-
-                    print(f"Found {len(game_cards)} games")
+                    with profile_page(self.profiler, self.driver, url):
+                        game_cards = self.discover_page_extractor(url, writer)
 
                     if not game_cards:
                         print("No more games found. Stopping.")
                         break  # Stop if no more content is available
 
-                    for game in game_cards:
-                        try:
-                            element = game.find_element(By.CSS_SELECTOR, "a.project-card__title")
-                            game_name = element.text.strip()
-                            game_url = element.get_attribute("href").strip()
-                            if game_url:
-                                writer.writerow([game_name, game_url])
-
-                        except Exception as e:
-                            print(f"Error extracting game: {e}")
-                            continue
-
             except Exception as e:
                 print(f"Error loading page {page}: {e}")
 
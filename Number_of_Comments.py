@@ -3,14 +3,20 @@ import csv
 from openpyxl import load_workbook
 from selenium.webdriver.common.by import By
 import undetected_chromedriver as uc
+from browser_session import BrowserSession
 
 
 class CommentSize:
-    def __init__(self):
+    def __init__(self, max_pages=250, max_rss_mb=1500):
         """
-            Initializes the web driver session with optimized settings.
+            Initializes the web driver session with optimized settings. The session is
+            recycled after max_pages projects or once the browser exceeds max_rss_mb.
         """
-        self.driver = self.setup_webdriver()
+        self.session = BrowserSession(self.setup_webdriver, max_pages=max_pages, max_rss_mb=max_rss_mb)
+
+    @property
+    def driver(self):
+        return self.session.driver
 
     @staticmethod
     def setup_webdriver():
@@ -76,6 +82,13 @@ class CommentSize:
             print(f"Error processing {url}: {e}")
             return "Error"
 
+    @staticmethod
+    def is_failed_count(count):
+        """
+            Marks the failure value of fetch_comment_count, which may hide a crashed browser.
+        """
+        return count == "Error"
+
     def process_urls(self, filepath, start_row, end_row, url_column, index_to_place_nums):
         """
             Extract and update comment counts for URLs stored in a DataFrame.
@@ -105,7 +118,8 @@ class CommentSize:
                         continue
 
                     print(f"Processing row {row}: {url}")
-                    sheet.cell(row=row, column=comment_num_index, value=self.fetch_comment_count(url))
+                    comment_count = self.session.run(self.fetch_comment_count, url, suspect_result=self.is_failed_count)
+                    sheet.cell(row=row, column=comment_num_index, value=comment_count)
 
                     try:
                         wb.save(filepath)
@@ -138,7 +152,7 @@ class CommentSize:
                         continue
 
                     print(f"Processing row {index + 2}: {url}")
-                    comment_count = self.fetch_comment_count(url)
+                    comment_count = self.session.run(self.fetch_comment_count, url, suspect_result=self.is_failed_count)
 
                     # Ensure the row is long enough
                     if len(row) <= comment_col_index:
@@ -0,0 +1,153 @@
+import psutil
+
+
+class BrowserSession:
+    def __init__(self, factory, max_pages=250, max_rss_mb=1500, memory_check_every=10):
+        """
+            Owns a Web Driver session and recycles it when the browser grows too large,
+            has served too many pages or stops responding.
+
+            Parameters:
+            - factory: Callable returning a freshly configured WebDriver (e.g. a scraper's setup_webdriver)
+            - max_pages: Number of work items served before the session is restarted
+            - max_rss_mb: Memory (MB) of the whole browser process tree that triggers a restart,
+              measured as proportional set size (see browser_memory_mb)
+            - memory_check_every: Number of work items between two measurements of the process tree
+        """
+        self.factory = factory
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.memory_check_every = memory_check_every
+        self.pages_served = 0
+        self.restarts = 0
+        self.driver = self.factory()
+        self.known_responsive = True  # A fresh browser, or one that just completed a work item
+
+    def browser_memory_mb(self):
+        """
+            Sums the memory of the chromedriver and Chrome processes, including every renderer,
+            GPU and utility child process. Chrome's processes share many pages, so each process
+            contributes its proportional set size (PSS, shared pages split between their users)
+            where the platform provides it, else its unique set size. Plain RSS is only used
+            when the detailed figures cannot be read.
+
+            Returns:
+            - Total memory in megabytes, or 0 if the processes cannot be inspected.
+        """
+        root_pids = {getattr(self.driver, "browser_pid", None)}
+        service = getattr(self.driver, "service", None)
+        if service is not None and getattr(service, "process", None) is not None:
+            root_pids.add(service.process.pid)
+
+        seen = set()
+        total = 0
+        for pid in root_pids - {None}:
+            try:
+                root = psutil.Process(pid)
+                processes = [root] + root.children(recursive=True)
+            except psutil.Error:
+                continue
+
+            for process in processes:
+                if process.pid in seen:
+                    continue
+                seen.add(process.pid)
+                try:
+                    memory = process.memory_full_info()
+                    total += getattr(memory, "pss", memory.uss)
+                except psutil.AccessDenied:
+                    try:
+                        total += process.memory_info().rss
+                    except psutil.Error:
+                        continue
+                except psutil.Error:
+                    continue
+
+        return total / (1024 * 1024)
+
+    def is_responsive(self):
+        """
+            Checks that the browser still answers WebDriver commands.
+        """
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def restart(self, reason):
+        """
+            Quits the current browser (ignoring errors from an already dead session)
+            and replaces it with a new one built by the factory.
+        """
+        print(f"Restarting browser session: {reason}")
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+        self.driver = self.factory()
+        self.pages_served = 0
+        self.restarts += 1
+        self.known_responsive = True
+
+    def recycle_if_needed(self):
+        """
+            Restarts the session if the page count or memory threshold has been reached,
+            or if the browser no longer responds. Memory is only measured every
+            memory_check_every items, and the responsiveness probe is skipped while the
+            previous work item is known to have finished on a live browser.
+        """
+        if self.pages_served >= self.max_pages:
+            self.restart(f"served {self.pages_served} pages")
+            return
+
+        if self.pages_served % self.memory_check_every == 0:
+            memory_mb = self.browser_memory_mb()
+            if memory_mb >= self.max_rss_mb:
+                self.restart(f"browser memory at {memory_mb:.0f} MB")
+                return
+
+        if not self.known_responsive and not self.is_responsive():
+            self.restart("browser not responding")
+
+    def run(self, task, *args, suspect_result=None):
+        """
+            Runs one work item against the managed session. If the browser dies while the
+            item is being processed, the session is restarted and the item is retried once,
+            so no input is lost to a crash.
+
+            Parameters:
+            - task: Scraper method that uses the driver (e.g. profile_search)
+            - args: Arguments for the task
+            - suspect_result: Optional callable for tasks that catch their own errors; it returns
+              True when a result may hide a browser crash (e.g. an empty list of links)
+
+            Returns:
+            - Whatever the task returns.
+        """
+        self.recycle_if_needed()
+        self.known_responsive = False
+
+        try:
+            result = task(*args)
+            # Tasks that swallow exceptions return a failure value instead of raising, so a
+            # browser crash only shows up by probing the driver. Valid results are never re-run.
+            crashed = suspect_result is not None and suspect_result(result) and not self.is_responsive()
+        except Exception:
+            if self.is_responsive():
+                self.known_responsive = True
+                raise
+            crashed = True
+
+        if crashed:
+            self.restart("browser crashed during work item, retrying")
+            self.known_responsive = False
+            result = task(*args)
+
+        self.known_responsive = True
+        self.pages_served += 1
+        return result
+
+    def quit(self):
+        self.driver.quit()
@@ -0,0 +1,280 @@
+import csv
+import json
+import os
+import random
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+
+
+# CDP Performance metrics (seconds) used to split where a page spent its time
+TIMING_METRICS = ["ScriptDuration", "TaskDuration", "LayoutDuration", "RecalcStyleDuration"]
+
+# Resource timing entries (navigation + subresources) read from the page itself
+RESOURCE_TIMINGS_SCRIPT = """
+    const entries = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+    return entries.map(e => ({
+        name: e.name,
+        type: e.initiatorType || e.entryType,
+        start: e.startTime,
+        duration: e.duration,
+        dns: e.domainLookupEnd - e.domainLookupStart,
+        connect: e.connectEnd - e.connectStart,
+        ttfb: e.responseStart - e.requestStart,
+        download: e.responseEnd - e.responseStart,
+        end: e.responseEnd,
+        size: e.transferSize
+    }));
+"""
+
+# Identity of the current document and the current time on its clock (ms)
+DOCUMENT_SCRIPT = "return {origin: performance.timeOrigin, now: performance.now()};"
+
+# Navigation latency (seconds) of the current document: until the load event, or DOMContentLoaded
+# if the page is still loading (the scrapers use the 'eager' page load strategy)
+NAVIGATION_SCRIPT = """
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (!nav) return null;
+    return {
+        origin: performance.timeOrigin,
+        url: location.href,
+        latency: (nav.loadEventEnd || nav.domContentLoadedEventEnd || nav.responseEnd) / 1000
+    };
+"""
+
+# The browser keeps only 250 resource timing entries by default; long "load more" pages exceed that
+RESOURCE_BUFFER_SIZE = 5000
+RESOURCE_BUFFER_SCRIPT = f"performance.setResourceTimingBufferSize({RESOURCE_BUFFER_SIZE});"
+
+
+def profile_page(profiler, driver, label):
+    """
+        Returns the profiler context for one page visit, or a no-op context if profiler is None.
+    """
+    if profiler is None:
+        return nullcontext()
+    return profiler.profile(driver, label)
+
+
+def record_navigation(profiler, driver):
+    """
+        Records the navigation timing of the page just loaded with driver.get, if profiling is on.
+    """
+    if profiler is not None:
+        profiler.record_navigation(driver)
+
+
+class PageProfiler:
+    def __init__(self, output_dir="traces", sample_rate=0.05, slow_threshold=10.0, top_resources=5):
+        """
+            Opt-in profiler that records CDP performance metrics and network timing for page visits.
+
+            Parameters:
+            - output_dir: Folder where trace files and the summary report are written
+            - sample_rate: Fraction of page visits (0 to 1) that are always traced
+            - slow_threshold: Navigation latency (seconds) above which a page visit is traced regardless of sampling
+            - top_resources: Number of slowest resources listed in the summary report
+        """
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self.top_resources = top_resources
+        self.traces_saved = 0
+        self.navigations = None  # {document timeOrigin: navigation} for the block being profiled
+        os.makedirs(self.output_dir, exist_ok=True)
+
+    @staticmethod
+    def read_metrics(driver):
+        """
+            Reads the CDP Performance domain counters as a {name: value} dict.
+        """
+        metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})
+        return {metric["name"]: metric["value"] for metric in metrics.get("metrics", [])}
+
+    @staticmethod
+    def network_time(resources):
+        """
+            Wall-clock seconds during which at least one request was in flight,
+            so parallel downloads are not counted twice.
+        """
+        intervals = sorted((r["start"], r["end"]) for r in resources if r["end"] and r["end"] >= r["start"])
+        total = 0.0
+        current_start, current_end = None, None
+        for start, end in intervals:
+            if current_end is None or start > current_end:
+                if current_end is not None:
+                    total += current_end - current_start
+                current_start, current_end = start, end
+            else:
+                current_end = max(current_end, end)
+        if current_end is not None:
+            total += current_end - current_start
+        return total / 1000
+
+    def record_navigation(self, driver):
+        """
+            Stores the navigation timing of the current document for the block being profiled.
+            Scrapers call it right after driver.get, so a later click that loads another
+            document does not hide the latency of the page itself.
+        """
+        if self.navigations is None:
+            return
+        try:
+            navigation = driver.execute_script(NAVIGATION_SCRIPT)
+        except Exception as e:
+            print(f"Profiler could not read navigation timing: {e}")
+            return
+        if not navigation:
+            return
+
+        # The same document read twice keeps the later, more complete figure (load event vs DOMContentLoaded)
+        known = self.navigations.get(navigation["origin"])
+        if known is None or navigation["latency"] > known["latency"]:
+            self.navigations[navigation["origin"]] = navigation
+
+    @contextmanager
+    def profile(self, driver, label):
+        """
+            Context manager wrapping the work done for one page. The visit is traced if it was
+            sampled or the slowest navigation seen in the block took longer than slow_threshold
+            seconds. Time spent in the scraper's own sleeps and waits is reported as elapsed
+            time but never makes a page slow.
+
+            Parameters:
+            - driver: WebDriver session used inside the block
+            - label: Identifier for the page, usually its URL
+        """
+        sampled = random.random() < self.sample_rate
+        start_document = None
+        start_metrics = {}
+        buffer_script_id = None
+        try:
+            # Restart the counters so they cover this block only
+            driver.execute_cdp_cmd("Performance.disable", {})
+            driver.execute_cdp_cmd("Performance.enable", {})
+            start_metrics = self.read_metrics(driver)
+            start_document = driver.execute_script(DOCUMENT_SCRIPT)
+
+            # Enlarge the resource timing buffer for the current document and any document loaded in the block
+            driver.execute_script(RESOURCE_BUFFER_SCRIPT)
+            buffer_script_id = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                                      {"source": RESOURCE_BUFFER_SCRIPT}).get("identifier")
+        except Exception as e:
+            print(f"Profiler could not prepare page: {e}")
+
+        self.navigations = {}
+        error = None
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            error = repr(e)
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.record_navigation(driver)
+            navigations, self.navigations = list(self.navigations.values()), None
+            try:
+                if buffer_script_id is not None:
+                    driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument",
+                                           {"identifier": buffer_script_id})
+            except Exception as e:
+                print(f"Profiler could not clean up page: {e}")
+
+            slowest = max(navigations, key=lambda n: n["latency"], default=None)
+            slow = slowest is not None and slowest["latency"] >= self.slow_threshold
+            if sampled or slow:
+                self.save_trace(driver, label, elapsed, slowest, start_document, start_metrics,
+                                "slow" if slow else "sampled", error)
+
+    @staticmethod
+    def measurement_window(start_document, end_document, start_metrics, end_metrics, resources):
+        """
+            Puts the CDP counters and the resource timings on the same time window.
+
+            If the block ended on the document it started on, both cover the block: counters
+            are the difference since the start, resources are those requested after it started.
+            If a navigation replaced the document, the start counters belong to another
+            document (and possibly another renderer), so the end counters are used as they are
+            and the resources are all those of the final document.
+
+            Returns:
+            - (window name, {metric: seconds}, resources in the window)
+        """
+        same_document = start_document is not None and start_document["origin"] == end_document["origin"]
+        if same_document:
+            window = "block"
+            durations = {name: end_metrics.get(name, 0) - start_metrics.get(name, 0) for name in TIMING_METRICS}
+            resources = [r for r in resources if r["start"] >= start_document["now"]]
+        else:
+            window = "document"
+            durations = {name: end_metrics.get(name, 0) for name in TIMING_METRICS}
+
+        return window, {name: max(value, 0) for name, value in durations.items()}, resources
+
+    def save_trace(self, driver, label, elapsed, navigation, start_document, start_metrics, reason, error=None):
+        """
+            Collects the end-of-visit metrics and resource timings, writes them to a JSON
+            trace file and appends one summary row to summary.csv.
+
+            Parameters:
+            - elapsed: Seconds spent in the whole profiled block, including the scraper's sleeps and waits
+            - navigation: Slowest navigation seen in the block, or None if none could be read
+            - start_document: Document identity read when the block started
+        """
+        try:
+            end_metrics = self.read_metrics(driver)
+            end_document = driver.execute_script(DOCUMENT_SCRIPT)
+            resources = driver.execute_script(RESOURCE_TIMINGS_SCRIPT) or []
+        except Exception as e:
+            print(f"Profiler could not collect trace for {label}: {e}")
+            return
+
+        window, durations, resources = self.measurement_window(start_document, end_document,
+                                                               start_metrics, end_metrics, resources)
+        slowest = sorted(resources, key=lambda r: r["duration"], reverse=True)[:self.top_resources]
+
+        summary = {
+            "url": label,
+            "reason": reason,
+            "document": navigation["url"] if navigation else None,
+            "navigation_s": round(navigation["latency"], 3) if navigation else None,
+            "elapsed_s": round(elapsed, 3),
+            "window": window,
+            "scripting_s": round(durations["ScriptDuration"], 3),
+            "layout_s": round(durations["LayoutDuration"] + durations["RecalcStyleDuration"], 3),
+            "task_s": round(durations["TaskDuration"], 3),
+            "network_s": round(self.network_time(resources), 3),
+            "resources": len(resources),
+            "slowest_resources": [f"{r['name']} ({r['duration']:.0f} ms)" for r in slowest],
+            "error": error,
+        }
+
+        # Process id and a random suffix keep concurrent runs sharing output_dir from overwriting each other
+        self.traces_saved += 1
+        trace_name = f"trace_{time.strftime('%Y%m%d-%H%M%S')}_{os.getpid()}_{uuid.uuid4().hex[:8]}.json"
+        trace_path = os.path.join(self.output_dir, trace_name)
+        try:
+            with open(trace_path, "x", encoding="utf-8") as file:
+                json.dump({"summary": summary,
+                           "metrics_start": start_metrics,
+                           "metrics_end": end_metrics,
+                           "resources": resources}, file, indent=2)
+
+            report_path = os.path.join(self.output_dir, "summary.csv")
+            report_exists = os.path.exists(report_path)
+            with open(report_path, "a", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                if not report_exists:
+                    writer.writerow(["Trace", "URL", "Reason", "Document", "Navigation (s)", "Elapsed (s)", "Window",
+                                     "Scripting (s)", "Layout (s)", "Network (s)", "Resources", "Slowest Resources",
+                                     "Error"])
+                writer.writerow([trace_name, label, reason, summary["document"], summary["navigation_s"],
+                                 summary["elapsed_s"], window, summary["scripting_s"], summary["layout_s"],
+                                 summary["network_s"], summary["resources"],
+                                 " | ".join(summary["slowest_resources"]), error or ""])
+        except Exception as e:
+            print(f"Error saving trace: {e}")
+            return
+
+        print(f"Trace saved for {label} ({reason}): {trace_path}")
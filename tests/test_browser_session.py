@@ -0,0 +1,118 @@
+import pytest
+
+from browser_session import BrowserSession
+
+
+class FakeDriver:
+    """
+        Stands in for uc.Chrome: answers execute_script until it is marked dead.
+    """
+    def __init__(self):
+        self.alive = True
+        self.probes = 0
+        self.quit_called = False
+
+    def execute_script(self, script):
+        self.probes += 1
+        if not self.alive:
+            raise ConnectionRefusedError("chromedriver is gone")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_session(**kwargs):
+    drivers = []
+
+    def factory():
+        drivers.append(FakeDriver())
+        return drivers[-1]
+
+    return BrowserSession(factory, **kwargs), drivers
+
+
+def test_crash_during_item_restarts_and_retries_once():
+    session, drivers = make_session()
+    calls = []
+
+    def task(item):
+        calls.append(item)
+        if len(calls) == 1:
+            session.driver.alive = False
+            raise ConnectionRefusedError("connection refused")
+        return f"done {item}"
+
+    assert session.run(task, "a") == "done a"
+    assert calls == ["a", "a"]
+    assert len(drivers) == 2 and drivers[0].quit_called
+    assert session.restarts == 1
+
+
+def test_error_on_live_browser_is_raised_without_retry():
+    session, drivers = make_session()
+    calls = []
+
+    def task(item):
+        calls.append(item)
+        raise ValueError("bad page")
+
+    with pytest.raises(ValueError):
+        session.run(task, "a")
+    assert calls == ["a"] and len(drivers) == 1
+
+
+def test_valid_result_is_kept_even_if_browser_dies_afterwards():
+    session, drivers = make_session()
+    calls = []
+
+    def task(item):
+        calls.append(item)
+        session.driver.alive = False
+        return ["link"]
+
+    assert session.run(task, "a", suspect_result=lambda links: not links) == ["link"]
+    assert calls == ["a"] and len(drivers) == 1
+
+
+def test_suspect_result_from_dead_browser_is_retried():
+    session, drivers = make_session()
+    calls = []
+
+    def task(item):
+        calls.append(item)
+        if len(calls) == 1:
+            session.driver.alive = False
+            return []
+        return ["link"]
+
+    assert session.run(task, "a", suspect_result=lambda links: not links) == ["link"]
+    assert calls == ["a", "a"] and len(drivers) == 2
+
+
+def test_session_recycled_after_max_pages():
+    session, drivers = make_session(max_pages=3)
+    for item in range(7):
+        session.run(lambda x: x, item)
+
+    assert len(drivers) == 3
+    assert session.pages_served == 1
+
+
+def test_responsiveness_not_probed_between_successful_items():
+    session, drivers = make_session()
+    for item in range(5):
+        session.run(lambda x: x, item)
+
+    assert drivers[0].probes == 0
+
+
+def test_memory_threshold_triggers_restart(monkeypatch):
+    session, drivers = make_session(max_rss_mb=100, memory_check_every=2)
+    readings = iter([10, 500])
+    monkeypatch.setattr(session, "browser_memory_mb", lambda: next(readings))
+
+    for item in range(3):
+        session.run(lambda x: x, item)
+
+    assert len(drivers) == 2
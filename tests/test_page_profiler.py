@@ -0,0 +1,147 @@
+import csv
+import os
+
+import pytest
+
+from page_profiler import (DOCUMENT_SCRIPT, NAVIGATION_SCRIPT, RESOURCE_TIMINGS_SCRIPT, PageProfiler,
+                           profile_page, record_navigation)
+
+
+class FakeDriver:
+    """
+        Stands in for uc.Chrome: every navigation creates a new document with its own
+        navigation latency, resource timings and CDP counters that start again from zero.
+    """
+    def __init__(self):
+        self.document = None
+        self.documents = 0
+        self.navigate("about:blank", latency=0.1)
+
+    def navigate(self, url, latency, script=0.0, resources=()):
+        self.documents += 1
+        self.document = {"origin": 1000.0 * self.documents, "url": url, "latency": latency,
+                         "now": 0.0, "script": script, "resources": list(resources)}
+
+    def get(self, url, latency=1.0, script=0.0, resources=()):
+        self.navigate(url, latency, script, resources)
+
+    def execute_script(self, script):
+        document = self.document
+        if script == DOCUMENT_SCRIPT:
+            return {"origin": document["origin"], "now": document["now"]}
+        if script == NAVIGATION_SCRIPT:
+            return {"origin": document["origin"], "url": document["url"], "latency": document["latency"]}
+        if script == RESOURCE_TIMINGS_SCRIPT:
+            return document["resources"]
+        return None
+
+    def execute_cdp_cmd(self, cmd, args):
+        if cmd == "Performance.getMetrics":
+            return {"metrics": [{"name": "ScriptDuration", "value": self.document["script"]}]}
+        if cmd == "Page.addScriptToEvaluateOnNewDocument":
+            return {"identifier": "1"}
+        return {}
+
+
+def resource(name, start, end):
+    return {"name": name, "start": start, "end": end, "duration": end - start}
+
+
+def read_summary(output_dir):
+    path = os.path.join(output_dir, "summary.csv")
+    if not os.path.exists(path):
+        return []
+    with open(path, newline="", encoding="utf-8") as file:
+        return list(csv.DictReader(file))
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    return str(tmp_path / "traces")
+
+
+def test_network_time_merges_overlapping_requests():
+    resources = [resource("a", 0, 100), resource("b", 50, 150), resource("c", 300, 400), resource("d", 320, 350)]
+    assert PageProfiler.network_time(resources) == pytest.approx(0.25)
+    assert PageProfiler.network_time([]) == 0
+
+
+def test_fast_unsampled_page_is_not_traced(output_dir):
+    profiler = PageProfiler(output_dir=output_dir, sample_rate=0, slow_threshold=10)
+    driver = FakeDriver()
+    with profile_page(profiler, driver, "fast"):
+        driver.get("https://example.com/fast", latency=2)
+        record_navigation(profiler, driver)
+
+    assert read_summary(output_dir) == []
+
+
+def test_sampled_page_is_traced(output_dir):
+    profiler = PageProfiler(output_dir=output_dir, sample_rate=1, slow_threshold=10)
+    driver = FakeDriver()
+    with profile_page(profiler, driver, "fast"):
+        driver.get("https://example.com/fast", latency=2)
+
+    rows = read_summary(output_dir)
+    assert [row["Reason"] for row in rows] == ["sampled"]
+
+
+def test_slow_navigation_is_traced_even_if_a_later_document_is_fast(output_dir):
+    profiler = PageProfiler(output_dir=output_dir, sample_rate=0, slow_threshold=10)
+    driver = FakeDriver()
+    with profile_page(profiler, driver, "https://example.com/project"):
+        driver.get("https://example.com/project", latency=12)
+        record_navigation(profiler, driver)
+        driver.get("https://example.com/project/comments", latency=1)
+
+    rows = read_summary(output_dir)
+    assert len(rows) == 1
+    assert rows[0]["Reason"] == "slow"
+    assert rows[0]["Document"] == "https://example.com/project"
+    assert float(rows[0]["Navigation (s)"]) == 12
+
+
+def test_counters_are_not_subtracted_across_documents(output_dir):
+    profiler = PageProfiler(output_dir=output_dir, sample_rate=1)
+    driver = FakeDriver()
+    driver.document["script"] = 5.0
+    with profile_page(profiler, driver, "page"):
+        driver.get("https://example.com/page", script=0.2, resources=[resource("a", 0, 300)])
+
+    row = read_summary(output_dir)[0]
+    assert row["Window"] == "document"
+    assert float(row["Scripting (s)"]) == pytest.approx(0.2)
+    assert float(row["Network (s)"]) == pytest.approx(0.3)
+
+
+def test_same_document_uses_block_window(output_dir):
+    profiler = PageProfiler(output_dir=output_dir, sample_rate=1)
+    driver = FakeDriver()
+    driver.document.update({"script": 1.0, "now": 500.0, "resources": [resource("old", 0, 400)]})
+    with profile_page(profiler, driver, "page"):
+        driver.document["script"] = 1.5
+        driver.document["resources"].append(resource("new", 600, 700))
+
+    row = read_summary(output_dir)[0]
+    assert row["Window"] == "block"
+    assert float(row["Scripting (s)"]) == pytest.approx(0.5)
+    assert row["Resources"] == "1"
+    assert float(row["Network (s)"]) == pytest.approx(0.1)
+
+
+def test_trace_files_do_not_overwrite_each_other(output_dir):
+    profiler = PageProfiler(output_dir=output_dir, sample_rate=1)
+    driver = FakeDriver()
+    for _ in range(3):
+        with profile_page(profiler, driver, "page"):
+            driver.get("https://example.com/page")
+
+    traces = [name for name in os.listdir(output_dir) if name.endswith(".json")]
+    assert len(traces) == 3
+
+
+def test_profiling_off_is_a_no_op():
+    driver = FakeDriver()
+    with profile_page(None, driver, "page"):
+        driver.get("https://example.com/page")
+    record_navigation(None, driver)
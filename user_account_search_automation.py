@@ -7,14 +7,20 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import undetected_chromedriver as uc
+from browser_session import BrowserSession
 
 
 class SocialMediaProfileScraper:
-    def __init__(self):
+    def __init__(self, max_pages=250, max_rss_mb=1500):
         """
-            Initializes the web driver session with optimized settings.
+            Initializes the web driver session with optimized settings. The session is
+            recycled after max_pages searches or once the browser exceeds max_rss_mb.
         """
-        self.driver = self.setup_webdriver()
+        self.session = BrowserSession(self.setup_webdriver, max_pages=max_pages, max_rss_mb=max_rss_mb)
+
+    @property
+    def driver(self):
+        return self.session.driver
 
     @staticmethod
     def setup_webdriver():
@@ -161,7 +167,7 @@ class SocialMediaProfileScraper:
 
             try:
                 for username in usernames:
-                    links = self.profile_search(username)
+                    links = self.session.run(self.profile_search, username, suspect_result=lambda links: not links)
                     if links:
                         writer.writerow([username] + links[:9])  # Writing without reopening the file
                     else:
@@ -171,7 +177,7 @@ class SocialMediaProfileScraper:
             except KeyboardInterrupt:
                 print("Process interrupted. Saved Progress")
             finally:
-                self.driver.quit()
+                self.session.quit()
                 print(f"Driver Closed")
 
 